@@ -6,10 +6,30 @@ import os
 import unittest
 from unittest.mock import Mock, patch, MagicMock
 import tempfile
-import csv
-from typing import List, Dict, Optional, Tuple
+import io
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, List, Dict, NamedTuple, Optional, Tuple
 from pathlib import Path
 
+import numpy as np
+
+try:
+    import numba
+except ImportError:  # Numba is optional; fall back to plain NumPy
+    numba = None
+
+try:
+    import numexpr
+except ImportError:  # numexpr is optional; fall back to plain NumPy
+    numexpr = None
+
+try:
+    import pyarrow.csv as pacsv
+except ImportError:  # PyArrow is optional; fall back to np.loadtxt
+    pacsv = None
+
 # Add current directory to path for importing our modules
 sys.path.insert(0, os.path.dirname(__file__))
 
@@ -18,110 +38,298 @@ sys.path.insert(0, os.path.dirname(__file__))
 # ============================================================
 
 
+def _count_csv_columns(filepath: str) -> int:
+    """Number of columns in the first non-blank row, ignoring trailing commas."""
+    with open(filepath, "r") as file:
+        for line in file:
+            fields = line.rstrip().split(",")
+            while fields and not fields[-1].strip():
+                fields.pop()
+            if fields:
+                return len(fields)
+    return 0
+
+
+def _load_inflammation_csv(filepath: str) -> np.ndarray:
+    """Parse an inflammation CSV file into a float32 array.
+
+    Like the original csv.reader loader, an empty file gives no rows and
+    trailing empty cells (e.g. a trailing comma) are ignored.
+    """
+    num_columns = _count_csv_columns(filepath)
+    if num_columns == 0:
+        return np.empty((0, 0), dtype=np.float32)
+
+    # Readings are small half-unit values, so float32 is precise enough
+    if pacsv is not None:
+        # Arrow's multi-threaded parser; the files have no header row
+        table = pacsv.read_csv(
+            filepath,
+            read_options=pacsv.ReadOptions(autogenerate_column_names=True),
+            parse_options=pacsv.ParseOptions(delimiter=","),
+        )
+        columns = table.columns[:num_columns]
+        # Arrow reads empty cells as nulls; reject any left inside the data,
+        # as np.loadtxt does, rather than loading NaN readings
+        if any(column.null_count for column in columns):
+            raise ValueError(f"empty cell in {filepath}")
+        columns = [column.to_numpy() for column in columns]
+        return np.column_stack(columns).astype(np.float32, copy=False)
+
+    return np.loadtxt(
+        filepath,
+        delimiter=",",
+        dtype=np.float32,
+        ndmin=2,
+        usecols=range(num_columns),
+    )
+
+
+if numba is not None:
+
+    # No cache=True: loading a cached parallel kernel makes Numba import this
+    # module by name, which re-runs the script's top-level prints
+    @numba.njit(parallel=True)
+    def _detect_anomalies_nb(arr, threshold):
+        """Return (rows, cols) of anomalous readings using a two-pass kernel."""
+        num_patients, num_days = arr.shape
+
+        # First pass: count anomalies per patient so each row knows its offset
+        counts = np.zeros(num_patients, dtype=np.int64)
+        for i in numba.prange(num_patients):
+            count = 0
+            for j in range(num_days):
+                value = arr[i, j]
+                if value == 0.0 or (threshold > 0 and value > threshold):
+                    count += 1
+            counts[i] = count
+
+        offsets = np.zeros(num_patients + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum(counts)
+        rows = np.empty(offsets[-1], dtype=np.int32)
+        cols = np.empty(offsets[-1], dtype=np.int32)
+
+        # Second pass: each patient writes into its own slice of the output
+        for i in numba.prange(num_patients):
+            k = offsets[i]
+            for j in range(num_days):
+                value = arr[i, j]
+                if value == 0.0 or (threshold > 0 and value > threshold):
+                    rows[k] = i
+                    cols[k] = j
+                    k += 1
+
+        return rows, cols
+
+
+class _LRUCache(OrderedDict):
+    """Dict-like cache that evicts its least recently used entries.
+
+    Values are stored as-is (arrays are shared, never copied). Entries are
+    evicted once there are more than ``max_items`` of them or, if
+    ``max_bytes`` is set, once their combined ``nbytes`` exceeds it.
+    ``stamps`` holds optional per-entry metadata, dropped with its entry.
+    """
+
+    def __init__(self, max_items: int = 8, max_bytes: Optional[int] = None):
+        super().__init__()
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.stamps: Dict[str, Any] = {}
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+
+        # Always keep the newest entry, even if it alone exceeds max_bytes
+        while len(self) > 1 and (
+            len(self) > self.max_items
+            or (self.max_bytes is not None and self.nbytes > self.max_bytes)
+        ):
+            self.popitem(last=False)
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self.stamps.pop(key, None)
+
+    def pop(self, key, *default):
+        self.stamps.pop(key, None)
+        return super().pop(key, *default)
+
+    def popitem(self, last: bool = True):
+        key, value = super().popitem(last=last)
+        self.stamps.pop(key, None)
+        return key, value
+
+    def clear(self):
+        super().clear()
+        self.stamps.clear()
+
+    @property
+    def nbytes(self) -> int:
+        """Total size in bytes of the cached arrays."""
+        return sum(getattr(value, "nbytes", 0) for value in self.values())
+
+
+class SummaryReport(NamedTuple):
+    """Summary statistics for one inflammation data file."""
+
+    filename: str
+    num_patients: int = 0
+    num_days: int = 0
+    overall_average: float = 0.0
+    max_patient_index: int = -1
+    max_total_inflammation: float = 0.0
+    num_anomalies: int = 0
+    anomaly_rate: float = 0.0
+    error: Optional[str] = None
+
+
 class InflammationAnalyzer:
     """Class for analyzing inflammation data - our code under test."""
 
-    def __init__(self, data_directory: str = "data"):
+    # Arrays smaller than this skip the Numba kernel to avoid JIT overhead
+    _NUMBA_THRESHOLD = 100_000
+    # Arrays smaller than this skip numexpr, whose thread start-up would dominate
+    _NUMEXPR_THRESHOLD = 100_000
+
+    def __init__(
+        self,
+        data_directory: str = "data",
+        cache_max_items: int = 8,
+        cache_max_bytes: Optional[int] = None,
+    ):
         self.data_directory = data_directory
-        self.cache: Dict[str, List[List[float]]] = {}
+        # Stamps are the (mtime in ns, size) of each file when it was loaded
+        self.cache: Dict[str, np.ndarray] = _LRUCache(cache_max_items, cache_max_bytes)
 
-    def load_inflammation_data(self, filename: str) -> List[List[float]]:
+    def load_inflammation_data(self, filename: str) -> np.ndarray:
         """Load inflammation data from CSV file."""
-        if filename in self.cache:
-            return self.cache[filename]
-
         filepath = os.path.join(self.data_directory, filename)
-        data = []
 
         try:
-            with open(filepath, "r") as file:
-                reader = csv.reader(file)
-                for row in reader:
-                    # Convert string values to floats
-                    numeric_row = [float(value) for value in row if value.strip()]
-                    if numeric_row:  # Only add non-empty rows
-                        data.append(numeric_row)
+            stat = os.stat(filepath)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Data file not found: {filepath}")
+        # Size catches rewrites that land within the filesystem's mtime resolution
+        stamp = (stat.st_mtime_ns, stat.st_size)
+
+        # Serve from the cache unless the file has changed since it was loaded
+        if filename in self.cache and self.cache.stamps.get(filename) == stamp:
+            return self.cache[filename]
+
+        try:
+            data = _load_inflammation_csv(filepath)
         except FileNotFoundError:
             raise FileNotFoundError(f"Data file not found: {filepath}")
         except ValueError as e:
             raise ValueError(f"Invalid data format in {filename}: {e}")
 
-        # Cache the result
         self.cache[filename] = data
+        self.cache.stamps[filename] = stamp
         return data
 
     def calculate_daily_averages(self, data: List[List[float]]) -> List[float]:
         """Calculate average inflammation for each day."""
-        if not data:
+        if len(data) == 0:
             return []
 
-        num_days = len(data[0])
-        daily_sums = [0.0] * num_days
-
-        for patient_data in data:
-            for day, inflammation in enumerate(patient_data):
-                daily_sums[day] += inflammation
-
-        num_patients = len(data)
-        return [daily_sum / num_patients for daily_sum in daily_sums]
+        # Keep the caller's dtype; accumulate in float64 for the returned values
+        arr = np.asarray(data)
+        return (arr.sum(axis=0, dtype=np.float64) / len(arr)).tolist()
 
     def find_max_inflammation_patient(
         self, data: List[List[float]]
     ) -> Tuple[int, float]:
         """Find patient with highest total inflammation."""
-        if not data:
+        if len(data) == 0:
             return (-1, 0.0)
 
-        max_total = 0.0
-        max_patient_index = 0
+        totals = np.asarray(data).sum(axis=1, dtype=np.float64)
+        max_patient_index = int(totals.argmax())
+
+        return (max_patient_index, float(totals[max_patient_index]))
 
-        for i, patient_data in enumerate(data):
-            total_inflammation = sum(patient_data)
-            if total_inflammation > max_total:
-                max_total = total_inflammation
-                max_patient_index = i
+    def _anomaly_mask(self, arr: np.ndarray, threshold: float) -> np.ndarray:
+        """Boolean mask of readings that are exactly 0.0 or above threshold."""
+        if threshold <= 0:
+            return arr == 0.0
 
-        return (max_patient_index, max_total)
+        if numexpr is not None and arr.size >= self._NUMEXPR_THRESHOLD:
+            # Evaluate both comparisons in one fused, multi-threaded pass
+            return numexpr.evaluate(
+                "(arr == 0.0) | (arr > threshold)",
+                local_dict={"arr": arr, "threshold": threshold},
+            )
+
+        return (arr == 0.0) | (arr > threshold)
 
     def detect_anomalies(
         self, data: List[List[float]], threshold: float = 0.0
-    ) -> List[Tuple[int, int]]:
-        """Detect anomalous inflammation readings (exactly 0.0 or above threshold)."""
-        anomalies = []
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Detect anomalous inflammation readings (exactly 0.0 or above threshold).
 
-        for patient_idx, patient_data in enumerate(data):
-            for day_idx, inflammation in enumerate(patient_data):
-                if inflammation == 0.0 or (threshold > 0 and inflammation > threshold):
-                    anomalies.append((patient_idx, day_idx))
+        Returns parallel arrays of patient (row) and day (column) indices.
+        """
+        arr = np.asarray(data)
+        if arr.ndim != 2 or arr.size == 0:
+            return np.empty(0, dtype=np.int32), np.empty(0, dtype=np.int32)
 
-        return anomalies
+        if numba is not None and arr.size >= self._NUMBA_THRESHOLD:
+            rows, cols = _detect_anomalies_nb(arr, threshold)
+        else:
+            rows, cols = np.nonzero(self._anomaly_mask(arr, threshold))
+
+        return rows.astype(np.int32, copy=False), cols.astype(np.int32, copy=False)
+
+    def detect_anomalies_list(
+        self, data: List[List[float]], threshold: float = 0.0
+    ) -> List[Tuple[int, int]]:
+        """Detect anomalous readings as a list of (patient, day) tuples."""
+        rows, cols = self.detect_anomalies(data, threshold)
+        return list(zip(rows.tolist(), cols.tolist()))
 
-    def generate_summary_report(self, filename: str) -> Dict[str, any]:
+    def generate_summary_report(self, filename: str) -> SummaryReport:
         """Generate a comprehensive summary report."""
         try:
-            data = self.load_inflammation_data(filename)
-
-            daily_averages = self.calculate_daily_averages(data)
-            max_patient_idx, max_inflammation = self.find_max_inflammation_patient(data)
-            anomalies = self.detect_anomalies(data, threshold=20.0)
-
-            return {
-                "filename": filename,
-                "num_patients": len(data),
-                "num_days": len(data[0]) if data else 0,
-                "overall_average": (
-                    sum(daily_averages) / len(daily_averages) if daily_averages else 0.0
-                ),
-                "max_patient_index": max_patient_idx,
-                "max_total_inflammation": max_inflammation,
-                "num_anomalies": len(anomalies),
-                "anomaly_rate": (
-                    len(anomalies) / (len(data) * len(data[0])) if data else 0.0
+            arr = np.asarray(self.load_inflammation_data(filename))
+            num_patients, num_days = arr.shape if arr.ndim == 2 else (0, 0)
+            total_readings = num_patients * num_days
+
+            if total_readings:
+                # Compute every statistic from one array: column sums, row
+                # sums and the anomaly mask, rather than one pass per helper
+                col_sums = arr.sum(axis=0, dtype=np.float64)
+                row_sums = arr.sum(axis=1, dtype=np.float64)
+                overall_average = float(col_sums.sum()) / total_readings
+                max_patient_idx = int(row_sums.argmax())
+                max_inflammation = float(row_sums[max_patient_idx])
+                num_anomalies = int(self._anomaly_mask(arr, 20.0).sum())
+            else:
+                overall_average = 0.0
+                max_patient_idx, max_inflammation = -1, 0.0
+                num_anomalies = 0
+
+            return SummaryReport(
+                filename=filename,
+                num_patients=num_patients,
+                num_days=num_days,
+                overall_average=overall_average,
+                max_patient_index=max_patient_idx,
+                max_total_inflammation=max_inflammation,
+                num_anomalies=num_anomalies,
+                anomaly_rate=(
+                    num_anomalies / total_readings if total_readings else 0.0
                 ),
-            }
+            )
 
         except Exception as e:
-            return {"error": str(e), "filename": filename}
+            return SummaryReport(filename=filename, error=str(e))
 
 
 # ============================================================
@@ -134,34 +342,41 @@ print("=== Unit Testing with unittest ===")
 class TestInflammationAnalyzer(unittest.TestCase):
     """Test cases for InflammationAnalyzer class."""
 
-    def setUp(self):
-        """Set up test fixtures before each test method."""
+    @classmethod
+    def setUpClass(cls):
+        """Set up shared, read-only fixtures once for the whole class."""
         # Create a temporary directory for test data
-        self.test_dir = tempfile.mkdtemp()
-        self.analyzer = InflammationAnalyzer(data_directory=self.test_dir)
+        cls.test_dir = tempfile.mkdtemp()
 
         # Create sample test data
-        self.sample_data = [
-            [0.0, 1.0, 2.0, 3.0, 2.0, 1.0, 0.0],  # Patient 0
-            [1.0, 2.0, 3.0, 4.0, 3.0, 2.0, 1.0],  # Patient 1
-            [0.0, 0.5, 1.0, 1.5, 1.0, 0.5, 0.0],  # Patient 2
-        ]
+        cls.sample_data = (
+            (0.0, 1.0, 2.0, 3.0, 2.0, 1.0, 0.0),  # Patient 0
+            (1.0, 2.0, 3.0, 4.0, 3.0, 2.0, 1.0),  # Patient 1
+            (0.0, 0.5, 1.0, 1.5, 1.0, 0.5, 0.0),  # Patient 2
+        )
 
         # Create a test CSV file
-        self.test_filename = "test_inflammation.csv"
-        self.test_filepath = os.path.join(self.test_dir, self.test_filename)
-
-        with open(self.test_filepath, "w", newline="") as file:
-            writer = csv.writer(file)
-            for row in self.sample_data:
-                writer.writerow(row)
+        cls.test_filename = "test_inflammation.csv"
+        cls.test_filepath = os.path.join(cls.test_dir, cls.test_filename)
+
+        np.savetxt(
+            cls.test_filepath,
+            np.asarray(cls.sample_data, dtype=np.float32),
+            delimiter=",",
+            fmt="%g",
+        )
 
-    def tearDown(self):
-        """Clean up after each test method."""
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up the shared fixtures after all tests have run."""
         # Remove test files
         import shutil
 
-        shutil.rmtree(self.test_dir, ignore_errors=True)
+        shutil.rmtree(cls.test_dir, ignore_errors=True)
+
+    def setUp(self):
+        """Give each test a fresh analyzer so cache state stays isolated."""
+        self.analyzer = InflammationAnalyzer(data_directory=self.test_dir)
 
     def test_load_inflammation_data_success(self):
         """Test successful loading of inflammation data."""
@@ -177,6 +392,35 @@ class TestInflammationAnalyzer(unittest.TestCase):
         with self.assertRaises(FileNotFoundError):
             self.analyzer.load_inflammation_data("nonexistent.csv")
 
+    def _write_test_file(self, filename: str, content: str) -> None:
+        """Write a raw CSV fixture into the test directory."""
+        with open(os.path.join(self.test_dir, filename), "w") as f:
+            f.write(content)
+
+    def test_load_inflammation_data_trailing_comma(self):
+        """Test that trailing empty cells are ignored by every CSV parser."""
+        self._write_test_file("trailing_comma.csv", "1,2,3,\n4,5,6,\n")
+
+        # Check both the PyArrow parser (if installed) and np.loadtxt
+        for parser in (pacsv, None):
+            with self.subTest(parser=parser):
+                with patch.object(sys.modules[__name__], "pacsv", parser):
+                    analyzer = InflammationAnalyzer(data_directory=self.test_dir)
+                    data = analyzer.load_inflammation_data("trailing_comma.csv")
+                np.testing.assert_array_equal(data, [[1, 2, 3], [4, 5, 6]])
+
+    def test_generate_summary_report_empty_file(self):
+        """Test that an empty file gives an empty report with every CSV parser."""
+        self._write_test_file("empty.csv", "")
+
+        for parser in (pacsv, None):
+            with self.subTest(parser=parser):
+                with patch.object(sys.modules[__name__], "pacsv", parser):
+                    analyzer = InflammationAnalyzer(data_directory=self.test_dir)
+                    report = analyzer.generate_summary_report("empty.csv")
+                self.assertIsNone(report.error)
+                self.assertEqual((report.num_patients, report.num_days), (0, 0))
+
     def test_load_inflammation_data_caching(self):
         """Test that data is properly cached."""
         # Load data twice
@@ -187,6 +431,38 @@ class TestInflammationAnalyzer(unittest.TestCase):
         self.assertIs(data1, data2)
         self.assertIn(self.test_filename, self.analyzer.cache)
 
+    def test_load_inflammation_data_cache_is_per_instance(self):
+        """Test that analyzers never share cached arrays."""
+        data1 = self.analyzer.load_inflammation_data(self.test_filename)
+        data1[0, 0] = 99.0
+
+        other = InflammationAnalyzer(data_directory=self.test_dir)
+        data2 = other.load_inflammation_data(self.test_filename)
+
+        self.assertIsNot(data1, data2)
+        self.assertEqual(data2[0, 0], 0.0)
+
+    def test_load_inflammation_data_after_cache_clear(self):
+        """Test that clearing the cache forces the file to be read again."""
+        data1 = self.analyzer.load_inflammation_data(self.test_filename)
+        self.analyzer.cache.clear()
+        data2 = self.analyzer.load_inflammation_data(self.test_filename)
+
+        self.assertIsNot(data1, data2)
+        np.testing.assert_array_equal(data1, data2)
+
+    def test_load_inflammation_data_stamps_follow_cache(self):
+        """Test that file stamps are dropped along with their cache entries."""
+        analyzer = InflammationAnalyzer(data_directory=self.test_dir, cache_max_items=1)
+        self._write_test_file("other.csv", "1,2,3\n")
+
+        analyzer.load_inflammation_data(self.test_filename)
+        analyzer.load_inflammation_data("other.csv")
+        self.assertEqual(set(analyzer.cache.stamps), {"other.csv"})
+
+        analyzer.cache.clear()
+        self.assertEqual(analyzer.cache.stamps, {})
+
     def test_calculate_daily_averages(self):
         """Test daily average calculation."""
         averages = self.analyzer.calculate_daily_averages(self.sample_data)
@@ -202,8 +478,12 @@ class TestInflammationAnalyzer(unittest.TestCase):
         ]
 
         self.assertEqual(len(averages), 7)
-        for i, expected in enumerate(expected_averages):
-            self.assertAlmostEqual(averages[i], expected, places=2)
+        np.testing.assert_allclose(averages, expected_averages, atol=1e-2)
+
+    def test_calculate_daily_averages_keeps_precision(self):
+        """Test that float64 inputs are not downcast to float32."""
+        averages = self.analyzer.calculate_daily_averages([[0.1, 0.2], [0.3, 0.4]])
+        np.testing.assert_allclose(averages, [0.2, 0.3], rtol=1e-12)
 
     def test_calculate_daily_averages_empty_data(self):
         """Test daily averages with empty data."""
@@ -228,55 +508,61 @@ class TestInflammationAnalyzer(unittest.TestCase):
         self.assertEqual(patient_idx, -1)
         self.assertEqual(max_inflammation, 0.0)
 
+    def test_find_max_inflammation_patient_non_positive_totals(self):
+        """Test max inflammation when no patient has a positive total."""
+        patient_idx, max_inflammation = self.analyzer.find_max_inflammation_patient(
+            [[-3.0, -1.0], [-1.0, 0.0], [-2.0, -2.0]]
+        )
+        self.assertEqual(patient_idx, 1)
+        self.assertEqual(max_inflammation, -1.0)
+
     def test_detect_anomalies(self):
         """Test anomaly detection."""
         # Test detecting zero values
-        anomalies = self.analyzer.detect_anomalies(self.sample_data, threshold=0.0)
+        rows, cols = self.analyzer.detect_anomalies(self.sample_data, threshold=0.0)
 
         # Should find zero values at (0,0), (0,6), (2,0), (2,6)
-        zero_anomalies = [
-            (patient, day)
-            for patient, day in anomalies
-            if self.sample_data[patient][day] == 0.0
-        ]
-        self.assertEqual(len(zero_anomalies), 4)
-        self.assertIn((0, 0), zero_anomalies)
-        self.assertIn((0, 6), zero_anomalies)
-        self.assertIn((2, 0), zero_anomalies)
-        self.assertIn((2, 6), zero_anomalies)
+        is_zero = np.asarray(self.sample_data)[rows, cols] == 0.0
+        self.assertEqual(int(is_zero.sum()), 4)
+        self.assertTrue(((rows == 0) & (cols == 0) & is_zero).any())
+        self.assertTrue(((rows == 0) & (cols == 6) & is_zero).any())
+        self.assertTrue(((rows == 2) & (cols == 0) & is_zero).any())
+        self.assertTrue(((rows == 2) & (cols == 6) & is_zero).any())
 
     def test_detect_anomalies_with_threshold(self):
         """Test anomaly detection with threshold."""
         # Test with threshold of 3.5 (should catch 4.0 reading)
-        anomalies = self.analyzer.detect_anomalies(self.sample_data, threshold=3.5)
+        rows, cols = self.analyzer.detect_anomalies(self.sample_data, threshold=3.5)
 
         # Should find value 4.0 at (1, 3) plus all zeros
-        high_value_anomalies = [
-            (patient, day)
-            for patient, day in anomalies
-            if self.sample_data[patient][day] > 3.5
-        ]
-        self.assertEqual(len(high_value_anomalies), 1)
-        self.assertIn((1, 3), high_value_anomalies)
+        is_high = np.asarray(self.sample_data)[rows, cols] > 3.5
+        self.assertEqual(int(is_high.sum()), 1)
+        self.assertTrue(((rows == 1) & (cols == 3) & is_high).any())
+
+    def test_detect_anomalies_list(self):
+        """Test the (patient, day) tuple form of anomaly detection."""
+        anomalies = self.analyzer.detect_anomalies_list(self.sample_data, threshold=3.5)
+
+        self.assertEqual(anomalies, [(0, 0), (0, 6), (1, 3), (2, 0), (2, 6)])
 
     def test_generate_summary_report(self):
         """Test summary report generation."""
         report = self.analyzer.generate_summary_report(self.test_filename)
 
-        self.assertEqual(report["filename"], self.test_filename)
-        self.assertEqual(report["num_patients"], 3)
-        self.assertEqual(report["num_days"], 7)
-        self.assertEqual(report["max_patient_index"], 1)
-        self.assertAlmostEqual(report["max_total_inflammation"], 16.0)
-        self.assertIn("num_anomalies", report)
-        self.assertIn("anomaly_rate", report)
+        self.assertEqual(report.filename, self.test_filename)
+        self.assertEqual(report.num_patients, 3)
+        self.assertEqual(report.num_days, 7)
+        self.assertEqual(report.max_patient_index, 1)
+        self.assertAlmostEqual(report.max_total_inflammation, 16.0)
+        self.assertEqual(report.num_anomalies, 4)  # The four zero readings
+        self.assertAlmostEqual(report.anomaly_rate, 4 / 21)
 
     def test_generate_summary_report_error_handling(self):
         """Test summary report error handling."""
         report = self.analyzer.generate_summary_report("nonexistent.csv")
 
-        self.assertIn("error", report)
-        self.assertEqual(report["filename"], "nonexistent.csv")
+        self.assertIsNotNone(report.error)
+        self.assertEqual(report.filename, "nonexistent.csv")
 
 
 # ============================================================
@@ -311,8 +597,7 @@ class TestInflammationAnalyzerAdvanced(unittest.TestCase):
         averages = self.analyzer.calculate_daily_averages(mock_data)
         expected = [2.0, 4.0, 6.0]  # (1+2+3)/3, (2+4+6)/3, (3+6+9)/3
 
-        for i, expected_avg in enumerate(expected):
-            self.assertAlmostEqual(averages[i], expected_avg)
+        np.testing.assert_allclose(averages, expected)
 
     @patch.object(InflammationAnalyzer, "load_inflammation_data")
     def test_summary_report_with_mocked_loader(self, mock_loader):
@@ -327,8 +612,8 @@ class TestInflammationAnalyzerAdvanced(unittest.TestCase):
         mock_loader.assert_called_once_with("test.csv")
 
         # Verify report contents
-        self.assertEqual(report["num_patients"], 2)
-        self.assertEqual(report["num_days"], 5)
+        self.assertEqual(report.num_patients, 2)
+        self.assertEqual(report.num_days, 5)
 
 
 # ============================================================
@@ -354,13 +639,11 @@ class TestInflammationProperties(unittest.TestCase):
 
         # Property: All averages should be >= minimum individual reading
         min_reading = min(min(patient) for patient in test_data)
-        for avg in averages:
-            self.assertGreaterEqual(avg, min_reading)
+        self.assertTrue((np.asarray(averages) >= min_reading).all())
 
         # Property: All averages should be <= maximum individual reading
         max_reading = max(max(patient) for patient in test_data)
-        for avg in averages:
-            self.assertLessEqual(avg, max_reading)
+        self.assertTrue((np.asarray(averages) <= max_reading).all())
 
     def test_anomaly_detection_properties(self):
         """Test properties of anomaly detection."""
@@ -369,16 +652,15 @@ class TestInflammationProperties(unittest.TestCase):
             [2.0, 3.0, 4.0, 5.0],  # Normal values
         ]
 
-        anomalies = self.analyzer.detect_anomalies(test_data, threshold=20.0)
+        rows, cols = self.analyzer.detect_anomalies(test_data, threshold=20.0)
 
         # Property: All detected anomalies should be either 0.0 or > threshold
-        for patient_idx, day_idx in anomalies:
-            value = test_data[patient_idx][day_idx]
-            self.assertTrue(value == 0.0 or value > 20.0)
+        values = np.asarray(test_data)[rows, cols]
+        self.assertTrue(((values == 0.0) | (values > 20.0)).all())
 
         # Property: Number of anomalies should be <= total readings
         total_readings = sum(len(patient) for patient in test_data)
-        self.assertLessEqual(len(anomalies), total_readings)
+        self.assertLessEqual(len(rows), total_readings)
 
 
 # ============================================================
@@ -392,30 +674,21 @@ class InflammationTestData:
     """Test data factory for inflammation testing."""
 
     @staticmethod
-    def create_normal_data(
-        num_patients: int = 3, num_days: int = 5
-    ) -> List[List[float]]:
+    def create_normal_data(num_patients: int = 3, num_days: int = 5) -> np.ndarray:
         """Create normal inflammation data for testing."""
-        import random
-
-        random.seed(42)  # Ensure reproducible tests
-
-        data = []
-        for patient in range(num_patients):
-            patient_data = []
-            for day in range(num_days):
-                # Generate realistic inflammation pattern (starts low, peaks, then decreases)
-                base_inflammation = 2.0 + random.uniform(-0.5, 0.5)
-                day_factor = (
-                    1.0 + (day / num_days) * 2.0
-                    if day < num_days // 2
-                    else 3.0 - (day / num_days) * 2.0
-                )
-                inflammation = base_inflammation * day_factor
-                patient_data.append(round(inflammation, 1))
-            data.append(patient_data)
+        rng = np.random.default_rng(42)  # Ensure reproducible tests
 
-        return data
+        base_inflammation = 2.0 + rng.uniform(-0.5, 0.5, (num_patients, num_days))
+
+        # Generate realistic inflammation pattern (starts low, peaks, then decreases)
+        days = np.arange(num_days)
+        day_factor = np.where(
+            days < num_days // 2,
+            1.0 + (days / num_days) * 2.0,
+            3.0 - (days / num_days) * 2.0,
+        )
+
+        return np.round(base_inflammation * day_factor, 1).astype(np.float32)
 
     @staticmethod
     def create_anomalous_data() -> List[List[float]]:
@@ -455,20 +728,19 @@ class TestWithFixtures(unittest.TestCase):
         self.assertEqual(len(averages), 7)
 
         # All averages should be positive for normal data
-        for avg in averages:
-            self.assertGreater(avg, 0)
+        self.assertTrue((np.asarray(averages) > 0).all())
 
     def test_anomalous_data_detection(self):
         """Test anomaly detection with known anomalous data."""
         data = self.test_data_factory.create_anomalous_data()
 
-        anomalies = self.analyzer.detect_anomalies(data, threshold=20.0)
+        rows, cols = self.analyzer.detect_anomalies(data, threshold=20.0)
 
         # Should detect zeros and the spike value (25.0)
-        self.assertGreater(len(anomalies), 0)
+        self.assertGreater(len(rows), 0)
 
         # Verify specific anomalies are detected
-        anomaly_positions = set(anomalies)
+        anomaly_positions = set(zip(rows.tolist(), cols.tolist()))
         self.assertIn((0, 0), anomaly_positions)  # Zero at (0,0)
         self.assertIn((0, 3), anomaly_positions)  # Zero at (0,3)
         self.assertIn((1, 2), anomaly_positions)  # Spike at (1,2)
@@ -486,8 +758,8 @@ class TestWithFixtures(unittest.TestCase):
         self.assertEqual(averages, [1.0, 2.0, 3.0])
 
         # Test all zeros
-        anomalies = self.analyzer.detect_anomalies(edge_cases["all_zeros"])
-        self.assertEqual(len(anomalies), 6)  # All 6 readings should be anomalies
+        rows, cols = self.analyzer.detect_anomalies(edge_cases["all_zeros"])
+        self.assertEqual(len(rows), 6)  # All 6 readings should be anomalies
 
 
 # ============================================================
@@ -525,6 +797,39 @@ class TestPerformance(unittest.TestCase):
 
         print(f"  Large dataset processing time: {execution_time:.3f} seconds")
 
+    def _data_with_anomalies(self) -> np.ndarray:
+        """Normal data with zeros and spikes scattered through it."""
+        data = InflammationTestData.create_normal_data(50, 40)
+        data[::7, ::5] = 0.0
+        data[3::11, 2::9] = 25.0
+        return data
+
+    @unittest.skipIf(numba is None, "numba is not installed")
+    def test_numba_anomaly_kernel_matches_numpy(self):
+        """Test that the Numba anomaly kernel agrees with the NumPy path."""
+        data = self._data_with_anomalies()
+        accelerated = InflammationAnalyzer()
+        accelerated._NUMBA_THRESHOLD = 0  # Force the kernel for small input
+
+        for threshold in (0.0, 20.0):
+            with self.subTest(threshold=threshold):
+                rows, cols = accelerated.detect_anomalies(data, threshold)
+                expected_rows, expected_cols = np.nonzero(
+                    self.analyzer._anomaly_mask(data, threshold)
+                )
+                np.testing.assert_array_equal(rows, expected_rows)
+                np.testing.assert_array_equal(cols, expected_cols)
+
+    @unittest.skipIf(numexpr is None, "numexpr is not installed")
+    def test_numexpr_anomaly_mask_matches_numpy(self):
+        """Test that the numexpr anomaly mask agrees with plain NumPy."""
+        data = self._data_with_anomalies()
+        accelerated = InflammationAnalyzer()
+        accelerated._NUMEXPR_THRESHOLD = 0  # Force numexpr for small input
+
+        mask = accelerated._anomaly_mask(data, 20.0)
+        np.testing.assert_array_equal(mask, (data == 0.0) | (data > 20.0))
+
     def test_memory_usage_pattern(self):
         """Test memory usage patterns."""
         # Test that caching works efficiently
@@ -543,6 +848,30 @@ class TestPerformance(unittest.TestCase):
         # Verify cache growth
         self.assertEqual(len(self.analyzer.cache), initial_cache_size + 2)
 
+    def test_cache_evicts_least_recently_used(self):
+        """Test that the cache stays bounded and evicts the oldest entry."""
+        analyzer = InflammationAnalyzer(cache_max_items=2)
+        test_data = InflammationTestData.create_normal_data(10, 10)
+
+        analyzer.cache["test1.csv"] = test_data
+        analyzer.cache["test2.csv"] = test_data
+        analyzer.cache["test1.csv"]  # Mark test1.csv as recently used
+        analyzer.cache["test3.csv"] = test_data
+
+        self.assertEqual(list(analyzer.cache), ["test1.csv", "test3.csv"])
+        self.assertIs(analyzer.cache["test3.csv"], test_data)  # Stored, not copied
+
+    def test_cache_respects_byte_limit(self):
+        """Test that the cache evicts entries once the byte limit is exceeded."""
+        test_data = InflammationTestData.create_normal_data(10, 10)
+        analyzer = InflammationAnalyzer(cache_max_bytes=test_data.nbytes * 2)
+
+        for i in range(4):
+            analyzer.cache[f"test{i}.csv"] = test_data
+
+        self.assertEqual(len(analyzer.cache), 2)
+        self.assertLessEqual(analyzer.cache.nbytes, test_data.nbytes * 2)
+
 
 # ============================================================
 # Integration Testing
@@ -566,10 +895,7 @@ class TestIntegration(unittest.TestCase):
             filepath = os.path.join(self.test_dir, filename)
             test_data = InflammationTestData.create_normal_data(5 + i, 10)
 
-            with open(filepath, "w", newline="") as file:
-                writer = csv.writer(file)
-                for row in test_data:
-                    writer.writerow(row)
+            np.savetxt(filepath, test_data, delimiter=",", fmt="%g")
 
     def tearDown(self):
         import shutil
@@ -582,7 +908,7 @@ class TestIntegration(unittest.TestCase):
 
         for filename in self.test_files:
             report = self.analyzer.generate_summary_report(filename)
-            self.assertNotIn("error", report)
+            self.assertIsNone(report.error)
             reports.append(report)
 
         # Verify all reports were generated successfully
@@ -603,7 +929,7 @@ class TestIntegration(unittest.TestCase):
                 "num_anomalies",
             ]
             for key in required_keys:
-                self.assertIn(key, report)
+                self.assertTrue(hasattr(report, key))
 
     def test_cross_file_comparison(self):
         """Test comparing results across multiple files."""
@@ -611,14 +937,14 @@ class TestIntegration(unittest.TestCase):
         report2 = self.analyzer.generate_summary_report(self.test_files[1])
 
         # Both should be successful
-        self.assertNotIn("error", report1)
-        self.assertNotIn("error", report2)
+        self.assertIsNone(report1.error)
+        self.assertIsNone(report2.error)
 
         # Different files should have different patient counts (5 vs 6)
-        self.assertNotEqual(report1["num_patients"], report2["num_patients"])
+        self.assertNotEqual(report1.num_patients, report2.num_patients)
 
         # Both should have same number of days (10)
-        self.assertEqual(report1["num_days"], report2["num_days"])
+        self.assertEqual(report1.num_days, report2.num_days)
 
 
 # ============================================================
@@ -626,13 +952,18 @@ class TestIntegration(unittest.TestCase):
 # ============================================================
 
 
+def _run_test_class(test_class) -> Tuple[str, int, int, int]:
+    """Run one test class and return its output and result counts."""
+    stream = io.StringIO()
+    tests = unittest.TestLoader().loadTestsFromTestCase(test_class)
+    result = unittest.TextTestRunner(stream=stream, verbosity=2).run(tests)
+    return stream.getvalue(), result.testsRun, len(result.failures), len(result.errors)
+
+
 def run_all_tests():
     """Run all test suites."""
     print("=== Running All Tests ===")
 
-    # Create test suite
-    test_suite = unittest.TestSuite()
-
     # Add test classes
     test_classes = [
         TestInflammationAnalyzer,
@@ -643,24 +974,32 @@ def run_all_tests():
         TestIntegration,
     ]
 
-    for test_class in test_classes:
-        tests = unittest.TestLoader().loadTestsFromTestCase(test_class)
-        test_suite.addTests(tests)
-
-    # Run tests with detailed output
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(test_suite)
+    # The classes share no state, so run each one in its own process. Only
+    # forked workers are used: spawned ones would re-import this script and
+    # print its section banners again in the middle of the test output
+    if "fork" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("fork")
+        with ProcessPoolExecutor(mp_context=context) as executor:
+            outcomes = list(executor.map(_run_test_class, test_classes))
+    else:
+        outcomes = [_run_test_class(test_class) for test_class in test_classes]
+
+    tests_run = failures = errors = 0
+    for output, run, failed, errored in outcomes:
+        # Print detailed output class by class, in a stable order
+        sys.stderr.write(output)
+        tests_run += run
+        failures += failed
+        errors += errored
 
     # Print summary
     print(f"\n=== Test Summary ===")
-    print(f"Tests run: {result.testsRun}")
-    print(f"Failures: {len(result.failures)}")
-    print(f"Errors: {len(result.errors)}")
-    print(
-        f"Success rate: {((result.testsRun - len(result.failures) - len(result.errors)) / result.testsRun * 100):.1f}%"
-    )
+    print(f"Tests run: {tests_run}")
+    print(f"Failures: {failures}")
+    print(f"Errors: {errors}")
+    print(f"Success rate: {((tests_run - failures - errors) / tests_run * 100):.1f}%")
 
-    return result.wasSuccessful()
+    return failures == 0 and errors == 0
 
 
 # ============================================================
@@ -1,13 +1,23 @@
 # Episode 15: Object-Oriented Programming in Python
 # Sample code demonstrating OOP concepts for scientific Python programming
 
+import bisect
 import math
+import sys
 import json
 from datetime import datetime, date
 from typing import List, Dict, Optional, Union, Any, Tuple
 from abc import ABC, abstractmethod
 from enum import Enum
 import copy
+import threading
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:  # Numba is optional; fall back to plain NumPy
+    numba = None
 
 # ============================================================
 # Basic Class Definition and Instantiation
@@ -19,6 +29,18 @@ print("=== Basic Classes and Objects ===")
 class Patient:
     """Basic Patient class demonstrating class fundamentals."""
 
+    # Fixed attribute layout: no per-instance __dict__
+    __slots__ = (
+        "patient_id",
+        "name",
+        "age",
+        "weight",
+        "created_at",
+        "_readings",
+        "_reading_count",
+        "_reading_sum",
+    )
+
     # Class variables (shared by all instances)
     species = "Homo sapiens"
     total_patients = 0
@@ -30,9 +52,14 @@ class Patient:
         self.name = name
         self.age = age
         self.weight = weight
-        self.inflammation_readings = []
         self.created_at = datetime.now()
 
+        # Readings live in a growable array with a running total, so the
+        # average never needs to re-sum the whole history
+        self._readings = np.empty(8, dtype=np.float64)
+        self._reading_count = 0
+        self._reading_sum = 0.0
+
         # Update class variable
         Patient.total_patients += 1
 
@@ -40,13 +67,28 @@ class Patient:
         """Add an inflammation reading."""
         if reading < 0:
             raise ValueError("Inflammation reading cannot be negative")
-        self.inflammation_readings.append(reading)
+
+        if self._reading_count == len(self._readings):
+            # Double the capacity so appends stay amortized O(1)
+            self._readings = np.resize(self._readings, 2 * len(self._readings))
+
+        self._readings[self._reading_count] = reading
+        self._reading_count += 1
+        self._reading_sum += reading
+
+    @property
+    def inflammation_readings(self) -> np.ndarray:
+        """Read-only view of the readings recorded so far."""
+        # Writes through the view would desync the running _reading_sum
+        readings = self._readings[: self._reading_count]
+        readings.flags.writeable = False
+        return readings
 
     def get_average_inflammation(self) -> Optional[float]:
         """Calculate average inflammation."""
-        if not self.inflammation_readings:
+        if self._reading_count == 0:
             return None
-        return sum(self.inflammation_readings) / len(self.inflammation_readings)
+        return self._reading_sum / self._reading_count
 
     def __str__(self) -> str:
         """String representation for users."""
@@ -95,6 +137,7 @@ class SecurePatient:
         self._age = age
         self.__social_security = None  # Private attribute
         self._inflammation_readings = []
+        self._inflammation_sum = 0.0  # Running total, updated in add_reading
 
     @property
     def patient_id(self) -> str:
@@ -135,13 +178,14 @@ class SecurePatient:
         """Average inflammation (computed property)."""
         if not self._inflammation_readings:
             return None
-        return sum(self._inflammation_readings) / len(self._inflammation_readings)
+        return self._inflammation_sum / len(self._inflammation_readings)
 
     def add_reading(self, reading: float) -> None:
         """Add inflammation reading with validation."""
         if not isinstance(reading, (int, float)) or reading < 0:
             raise ValueError("Reading must be a non-negative number")
         self._inflammation_readings.append(float(reading))
+        self._inflammation_sum += float(reading)
 
     def get_readings(self) -> List[float]:
         """Get copy of readings (protecting internal state)."""
@@ -198,6 +242,9 @@ print("\n=== Inheritance and Polymorphism ===")
 class Person:
     """Base class for all people."""
 
+    # Subclasses declare only the slots they add
+    __slots__ = ("name", "age", "contact_info")
+
     def __init__(self, name: str, age: int, contact_info: str = ""):
         self.name = name
         self.age = age
@@ -220,6 +267,13 @@ class Person:
 class StudyParticipant(Person):
     """Study participant - inherits from Person."""
 
+    __slots__ = (
+        "participant_id",
+        "study_group",
+        "inflammation_data",
+        "enrollment_date",
+    )
+
     def __init__(
         self,
         name: str,
@@ -261,6 +315,13 @@ class StudyParticipant(Person):
 class Researcher(Person):
     """Researcher - another Person subclass."""
 
+    __slots__ = (
+        "employee_id",
+        "department",
+        "specialization",
+        "assigned_participants",
+    )
+
     def __init__(
         self,
         name: str,
@@ -290,11 +351,10 @@ class Researcher(Person):
         groups = {}
         total_data_points = 0
 
+        # One pass over the participants collects both statistics
         for participant in self.assigned_participants:
             group = participant.study_group
-            if group not in groups:
-                groups[group] = 0
-            groups[group] += 1
+            groups[group] = groups.get(group, 0) + 1
             total_data_points += len(participant.inflammation_data)
 
         return {
@@ -377,9 +437,41 @@ class DataProcessor(ABC):
         )
 
 
+if numba is not None:
+
+    # No fastmath: it assumes no NaNs, and NaN readings must stay NaN
+    @numba.njit(cache=True)
+    def _normalize_kernel(arr, scale):
+        """Multiply readings by scale, capping the result at 1.0."""
+        out = np.empty_like(arr)
+        for i in range(arr.size):
+            value = arr[i] * scale
+            # Only a reading above the cap is replaced, so NaN propagates
+            out[i] = 1.0 if value > 1.0 else value
+        return out
+
+    @numba.njit(cache=True)
+    def _smooth_kernel(arr, half_window):
+        """Moving average over windows clipped at both ends of the data."""
+        n = arr.size
+        cumulative = np.zeros(n + 1)
+        for i in range(n):
+            cumulative[i + 1] = cumulative[i] + arr[i]
+
+        out = np.empty(n)
+        for i in range(n):
+            start = max(0, i - half_window)
+            end = min(n, i + half_window + 1)
+            out[i] = (cumulative[end] - cumulative[start]) / (end - start)
+        return out
+
+
 class InflammationNormalizer(DataProcessor):
     """Concrete implementation: normalizes inflammation data."""
 
+    # Shorter inputs skip the Numba kernel to avoid its call overhead
+    _NUMBA_THRESHOLD = 100_000
+
     def __init__(self, max_value: float = 20.0):
         super().__init__("Inflammation Normalizer")
         self.max_value = max_value
@@ -389,7 +481,17 @@ class InflammationNormalizer(DataProcessor):
         if not data:
             return []
 
-        normalized = [min(value / self.max_value, 1.0) for value in data]
+        arr = np.asarray(data, dtype=np.float64)
+        # One division up front; every element is then a multiplication
+        scale = 1.0 / self.max_value
+
+        if numba is not None and arr.size >= self._NUMBA_THRESHOLD:
+            normalized = _normalize_kernel(arr, scale)
+        else:
+            normalized = np.multiply(arr, scale)
+            np.minimum(normalized, 1.0, out=normalized)  # Branchless clamp
+
+        normalized = normalized.tolist()
         self.log_processing(len(data), len(normalized))
         return normalized
 
@@ -405,6 +507,9 @@ class InflammationNormalizer(DataProcessor):
 class InflammationSmoother(DataProcessor):
     """Concrete implementation: smooths inflammation data."""
 
+    # Shorter inputs skip the Numba kernel to avoid its call overhead
+    _NUMBA_THRESHOLD = 100_000
+
     def __init__(self, window_size: int = 3):
         super().__init__("Inflammation Smoother")
         self.window_size = window_size
@@ -414,17 +519,22 @@ class InflammationSmoother(DataProcessor):
         if len(data) < self.window_size:
             return data.copy()
 
-        smoothed = []
+        arr = np.asarray(data, dtype=np.float64)
         half_window = self.window_size // 2
 
-        for i in range(len(data)):
-            start = max(0, i - half_window)
-            end = min(len(data), i + half_window + 1)
-            window_data = data[start:end]
-            smoothed.append(sum(window_data) / len(window_data))
+        if numba is not None and arr.size >= self._NUMBA_THRESHOLD:
+            smoothed = _smooth_kernel(arr, half_window)
+        else:
+            # Prefix sums turn every window total into a single subtraction;
+            # windows are clipped at both ends of the data
+            cumulative = np.concatenate(([0.0], arr.cumsum()))
+            indices = np.arange(len(arr))
+            starts = np.maximum(indices - half_window, 0)
+            ends = np.minimum(indices + half_window + 1, len(arr))
+            smoothed = (cumulative[ends] - cumulative[starts]) / (ends - starts)
 
         self.log_processing(len(data), len(smoothed))
-        return smoothed
+        return smoothed.tolist()
 
     def get_processing_info(self) -> Dict[str, Any]:
         """Get smoother information."""
@@ -459,6 +569,8 @@ print("\n=== Composition and Aggregation ===")
 class InflammationReading:
     """Represents a single inflammation reading."""
 
+    __slots__ = ("value", "timestamp", "location", "quality_score")
+
     def __init__(self, value: float, timestamp: datetime = None, location: str = ""):
         self.value = value
         self.timestamp = timestamp or datetime.now()
@@ -482,34 +594,54 @@ class InflammationReading:
 class DailyInflammationData:
     """Represents inflammation data for one day - composition example."""
 
+    __slots__ = (
+        "date",
+        "patient_id",
+        "_readings",
+        "notes",
+        "_value_sum",
+        "_quality_sum",
+    )
+
     def __init__(self, date: date, patient_id: str):
         self.date = date
         self.patient_id = patient_id
-        self.readings = []  # Composition: readings belong to this daily data
+        self._readings = []  # Composition: readings belong to this daily data
         self.notes = ""
+        # Running totals, updated in add_reading
+        self._value_sum = 0.0
+        self._quality_sum = 0.0
 
     def add_reading(self, value: float, location: str = "") -> InflammationReading:
         """Add a reading to this day."""
         reading = InflammationReading(value, datetime.now(), location)
-        self.readings.append(reading)
+        self._readings.append(reading)
+        self._value_sum += reading.value
+        self._quality_sum += reading.quality_score
         return reading
 
+    @property
+    def readings(self) -> Tuple[InflammationReading, ...]:
+        """Readings recorded for the day, read-only."""
+        # Edits must go through add_reading to keep the running totals valid
+        return tuple(self._readings)
+
     def get_average(self) -> Optional[float]:
         """Get average reading for the day."""
-        if not self.readings:
+        if not self._readings:
             return None
-        return sum(r.value for r in self.readings) / len(self.readings)
+        return self._value_sum / len(self._readings)
 
     def get_quality_score(self) -> float:
         """Get overall quality score for the day."""
-        if not self.readings:
+        if not self._readings:
             return 0.0
-        return sum(r.quality_score for r in self.readings) / len(self.readings)
+        return self._quality_sum / len(self._readings)
 
     def __str__(self) -> str:
         avg = self.get_average()
         avg_str = f"{avg:.2f}" if avg is not None else "N/A"
-        return f"DailyData({self.date}, {len(self.readings)} readings, avg={avg_str})"
+        return f"DailyData({self.date}, {len(self._readings)} readings, avg={avg_str})"
 
 
 class Study:
@@ -522,15 +654,19 @@ class Study:
             principal_investigator  # Aggregation: researcher exists independently
         )
         self.participants = []  # Aggregation: participants exist independently
+        self._participant_ids = set()  # For O(1) enrollment checks
         self.data_collection = {}  # Composition: data belongs to study
         self.start_date = date.today()
         self.status = "active"
 
     def enroll_participant(self, participant: StudyParticipant) -> None:
         """Enroll a participant in the study."""
-        if participant not in self.participants:
-            self.participants.append(participant)
-            self.data_collection[participant.participant_id] = []
+        if participant.participant_id in self._participant_ids:
+            return
+
+        self._participant_ids.add(participant.participant_id)
+        self.participants.append(participant)
+        self.data_collection[participant.participant_id] = []
 
     def add_daily_data(
         self, participant_id: str, daily_data: DailyInflammationData
@@ -605,6 +741,10 @@ for key, value in stats.items():
 print("\n=== Enums and Data Classes ===")
 
 
+# Inclusive upper bounds of the MILD, MODERATE and SEVERE bands
+_SEVERITY_BOUNDS = (2.0, 5.0, 10.0)
+
+
 class InflammationSeverity(Enum):
     """Enumeration for inflammation severity levels."""
 
@@ -619,14 +759,21 @@ class InflammationSeverity(Enum):
         """Convert numeric value to severity enum."""
         if value == 0:
             return cls.NONE
-        elif value <= 2:
-            return cls.MILD
-        elif value <= 5:
-            return cls.MODERATE
-        elif value <= 10:
-            return cls.SEVERE
-        else:
+        if math.isnan(value):
+            # NaN fails every "<=" test, so it falls through to the top band
             return cls.CRITICAL
+        # bisect_left counts the bounds below value, so a value equal to a
+        # bound stays in the lower band
+        return cls(bisect.bisect_left(_SEVERITY_BOUNDS, value) + 1)
+
+    @classmethod
+    def from_values(cls, values: List[float]) -> np.ndarray:
+        """Classify many readings at once, returning severity levels as int8."""
+        arr = np.asarray(values, dtype=np.float64)
+        levels = np.searchsorted(_SEVERITY_BOUNDS, arr, side="left") + 1
+        levels[arr == 0] = cls.NONE.value
+        levels[np.isnan(arr)] = cls.CRITICAL.value
+        return levels.astype(np.int8)
 
     def get_description(self) -> str:
         """Get human-readable description."""
@@ -752,19 +899,23 @@ class InflammationMonitor:
     def __init__(self):
         self.observers = []
         self.current_reading = 0.0
+        # Bound update methods, rebuilt whenever the observers change
+        self._updates = ()
 
     def add_observer(self, observer) -> None:
         """Add an observer."""
         self.observers.append(observer)
+        self._updates = tuple(o.update for o in self.observers)
 
     def remove_observer(self, observer) -> None:
         """Remove an observer."""
         self.observers.remove(observer)
+        self._updates = tuple(o.update for o in self.observers)
 
     def notify_observers(self, reading: float) -> None:
         """Notify all observers of reading change."""
-        for observer in self.observers:
-            observer.update(reading)
+        for update in self._updates:
+            update(reading)
 
     def set_reading(self, reading: float) -> None:
         """Set new reading and notify observers."""
@@ -835,6 +986,11 @@ print("\n=== Advanced OOP Features ===")
 
 
 # Context Managers
+# Mock data for demo, shared read-only across missing-file fallbacks
+_FALLBACK_DATA = np.array([[1.0, 2.0, 3.0]], dtype=np.float32)
+_FALLBACK_DATA.flags.writeable = False
+
+
 class InflammationDataFile:
     """Context manager for handling inflammation data files."""
 
@@ -842,23 +998,29 @@ class InflammationDataFile:
         self.filename = filename
         self.mode = mode
         self.file = None
-        self.data = []
+        self.data: Optional[np.ndarray] = None
 
     def __enter__(self):
         """Enter context - open file."""
         print(f"Opening file: {self.filename}")
         try:
-            self.file = open(self.filename, self.mode)
             if self.mode == "r":
-                # Read inflammation data
-                import csv
-
-                reader = csv.reader(self.file)
-                for row in reader:
-                    self.data.append([float(x) for x in row if x.strip()])
+                # Read inflammation data, ignoring trailing empty cells and
+                # blank rows as the csv.reader loop did
+                with open(self.filename, "r") as file:
+                    rows = [line.rstrip(", \t\r\n") for line in file]
+                rows = [row for row in rows if row]
+                if rows:
+                    self.data = np.loadtxt(
+                        rows, delimiter=",", dtype=np.float32, ndmin=2
+                    )
+                else:
+                    self.data = np.empty((0, 0), dtype=np.float32)
+            else:
+                self.file = open(self.filename, self.mode)
         except FileNotFoundError:
             print(f"File not found: {self.filename}")
-            self.data = [[1.0, 2.0, 3.0]]  # Mock data for demo
+            self.data = _FALLBACK_DATA
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -873,6 +1035,18 @@ class InflammationDataFile:
 class ValidatedAttribute:
     """Descriptor for validated attributes."""
 
+    __slots__ = ("min_value", "max_value", "name", "private_name")
+
+    def __new__(cls, min_value=None, max_value=None):
+        # Pick a private variant whose __set__ only checks the bounds actually
+        # given; user subclasses keep the general, fully checking __set__
+        if cls is ValidatedAttribute:
+            if min_value is not None:
+                cls = _BoundedAttribute if max_value is not None else _MinAttribute
+            elif max_value is not None:
+                cls = _MaxAttribute
+        return super().__new__(cls)
+
     def __init__(self, min_value=None, max_value=None):
         self.min_value = min_value
         self.max_value = max_value
@@ -884,14 +1058,50 @@ class ValidatedAttribute:
     def __get__(self, obj, objtype=None):
         if obj is None:
             return self
-        return getattr(obj, self.private_name, None)
+        # The private name is never a descriptor, so skip attribute lookup
+        return obj.__dict__.get(self.private_name)
 
     def __set__(self, obj, value):
         if self.min_value is not None and value < self.min_value:
             raise ValueError(f"{self.name} must be >= {self.min_value}")
         if self.max_value is not None and value > self.max_value:
             raise ValueError(f"{self.name} must be <= {self.max_value}")
-        setattr(obj, self.private_name, value)
+        obj.__dict__[self.private_name] = value
+
+
+class _MinAttribute(ValidatedAttribute):
+    """Validated attribute with only a lower bound."""
+
+    __slots__ = ()
+
+    def __set__(self, obj, value):
+        if value < self.min_value:
+            raise ValueError(f"{self.name} must be >= {self.min_value}")
+        obj.__dict__[self.private_name] = value
+
+
+class _MaxAttribute(ValidatedAttribute):
+    """Validated attribute with only an upper bound."""
+
+    __slots__ = ()
+
+    def __set__(self, obj, value):
+        if value > self.max_value:
+            raise ValueError(f"{self.name} must be <= {self.max_value}")
+        obj.__dict__[self.private_name] = value
+
+
+class _BoundedAttribute(ValidatedAttribute):
+    """Validated attribute with both bounds."""
+
+    __slots__ = ()
+
+    def __set__(self, obj, value):
+        if value < self.min_value:
+            raise ValueError(f"{self.name} must be >= {self.min_value}")
+        if value > self.max_value:
+            raise ValueError(f"{self.name} must be <= {self.max_value}")
+        obj.__dict__[self.private_name] = value
 
 
 class ValidatedPatient:
@@ -912,25 +1122,46 @@ class SingletonMeta(type):
     """Metaclass for implementing singleton pattern."""
 
     _instances = {}
+    # Reentrant so a singleton's __init__ can create another singleton
+    _lock = threading.RLock()
 
     def __call__(cls, *args, **kwargs):
-        if cls not in cls._instances:
-            cls._instances[cls] = super().__call__(*args, **kwargs)
-        return cls._instances[cls]
+        # Fast path: a single dict lookup once the instance exists
+        instance = cls._instances.get(cls)
+        if instance is not None:
+            return instance
+        with cls._lock:
+            instance = cls._instances.get(cls)
+            if instance is None:
+                instance = super().__call__(*args, **kwargs)
+                cls._instances[cls] = instance
+        return instance
+
+
+_DEFAULT_SETTINGS = {
+    "max_inflammation": 20.0,
+    "alert_threshold": 10.0,
+    "data_directory": "./data",
+}
 
 
 class ConfigurationManager(metaclass=SingletonMeta):
     """Configuration manager using metaclass singleton."""
 
     def __init__(self):
-        self.settings = {
-            "max_inflammation": 20.0,
-            "alert_threshold": 10.0,
-            "data_directory": "./data",
-        }
+        # Copied from the defaults on first write; reads use them directly
+        self._settings: Optional[Dict[str, Any]] = None
+
+    @property
+    def settings(self) -> Dict[str, Any]:
+        """The live settings dict, copied from the defaults on first access."""
+        if self._settings is None:
+            self._settings = dict(_DEFAULT_SETTINGS)
+        return self._settings
 
     def get(self, key: str, default=None):
-        return self.settings.get(key, default)
+        settings = self._settings if self._settings is not None else _DEFAULT_SETTINGS
+        return settings.get(key, default)
 
     def set(self, key: str, value) -> None:
         self.settings[key] = value
@@ -967,7 +1198,7 @@ print(f"Config setting from second instance: {config2.get('test_setting')}")
 
 print("\n=== OOP Best Practices ===")
 
-best_practices = [
+best_practices = (
     "✓ Use clear, descriptive class names (PascalCase)",
     "✓ Keep classes focused on single responsibility",
     "✓ Prefer composition over inheritance when possible",
@@ -983,13 +1214,12 @@ best_practices = [
     "✓ Consider using dataclasses for simple data containers",
     "✓ Test classes thoroughly, including edge cases",
     "✓ Document classes and methods with docstrings",
-]
+)
 
-for practice in best_practices:
-    print(f"  {practice}")
+sys.stdout.write("".join(f"  {practice}\n" for practice in best_practices))
 
 print("\n=== When to Use OOP ===")
-use_cases = [
+use_cases = (
     "🎯 Modeling real-world entities (Patient, Study, Equipment)",
     "🎯 Creating reusable components with shared behavior",
     "🎯 Managing complex state and interactions",
@@ -997,10 +1227,9 @@ use_cases = [
     "🎯 Implementing design patterns for common problems",
     "🎯 Creating APIs and frameworks for others to use",
     "🎯 Organizing large codebases with clear structure",
-]
+)
 
-for use_case in use_cases:
-    print(f"  {use_case}")
+sys.stdout.write("".join(f"  {use_case}\n" for use_case in use_cases))
 
 print(
     "\n💡 OOP is a powerful tool for organizing complex code and modeling real-world problems!"